@@ -10,10 +10,37 @@ Author: Siddhartha Srinivasa <siddh@cs.washington.edu>
 MIT License - see LICENSE file for details.
 """
 
-from .config import LabDataConfig, BibFile
-from .models import LabData, Publication, Author, Person, Project, Collaborator
-from .assembler import assemble, AssemblyResult
-from .exporters import export_to_yaml, export_to_json
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .config import LabDataConfig, BibFile
+    from .models import LabData, Publication, Author, Person, Project, Collaborator
+    from .assembler import assemble, AssemblyResult
+    from .exporters import export_to_yaml, export_to_json
+
+# Public name → defining submodule. Imported on first access (PEP 562), so
+# `import labdata` does not pull in bibtexparser and PyYAML until needed.
+_EXPORTS = {
+    "LabDataConfig": ".config",
+    "BibFile": ".config",
+    "LabData": ".models",
+    "Publication": ".models",
+    "Author": ".models",
+    "Person": ".models",
+    "Project": ".models",
+    "Collaborator": ".models",
+    "assemble": ".assembler",
+    "AssemblyResult": ".assembler",
+    "export_to_yaml": ".exporters",
+    "export_to_json": ".exporters",
+}
+
+# Submodules the eager imports used to bind, still reachable as attributes
+_SUBMODULES = frozenset({
+    "config", "models", "assembler", "exporters", "latex",
+    "loaders", "resolver", "parsers", "cli",
+})
 
 __all__ = [
     # Config
@@ -34,3 +61,18 @@ __all__ = [
     "export_to_json",
 ]
 __version__ = "2.0.0"
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        if name in _SUBMODULES:
+            return importlib.import_module(f".{name}", __name__)
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
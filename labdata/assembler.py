@@ -9,8 +9,13 @@ Author: Siddhartha Srinivasa <siddh@cs.washington.edu>
 MIT License - see LICENSE file for details.
 """
 
-from dataclasses import dataclass, field
-from typing import List, Optional
+import hashlib
+import json
+import os
+import pickle
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
 
 from .config import LabDataConfig
 from .models import LabData, Collaborator, Publication
@@ -36,17 +41,37 @@ def assemble(config: LabDataConfig, diagnostics: bool = False):
     4. Validate project IDs
     5. Compute back-links (people→pubs, projects→pubs, projects→people)
 
+    If config.cache_dir is set, the result is pickled there and reused
+    while the configuration and every input file are unchanged. Each
+    configuration keeps one cache file, replaced whenever an input changes.
+
     Args:
         config: Lab data configuration
         diagnostics: If True, return AssemblyResult with diagnostics.
                      If False (default), return LabData directly.
     """
+    cache_path = None
+    if config.cache_dir:
+        cache_path = Path(config.cache_dir) / f"{_config_key(config)}.pkl"
+        inputs_key = _inputs_key(config)
+        result = _load_cached(cache_path, inputs_key)
+        if result is not None:
+            return result if diagnostics else result.data
+
+    result = _assemble(config)
+    if cache_path is not None:
+        _store_cached(cache_path, inputs_key, result)
+    return result if diagnostics else result.data
+
+
+def _assemble(config: LabDataConfig) -> AssemblyResult:
     # Parse publications
     bib_files = [{'name': bf.name, 'category': bf.category} for bf in config.bib_files]
     publications = parse_all_publications(
         bib_dir=config.bib_dir,
         bib_files=bib_files,
         pdf_base_url=config.pdf_base_url,
+        workers=config.workers,
     )
 
     # Load people and projects
@@ -58,17 +83,18 @@ def assemble(config: LabDataConfig, diagnostics: bool = False):
     unknown_projects = resolve_projects(publications, projects)
 
     # Compute collaborators (external co-authors not in people.yaml)
-    collab_counts: dict = {}
-    collab_years: dict = {}
+    collabs: Dict[str, Collaborator] = {}
     for pub in publications:
         for author in pub.authors:
             if author.person_id is None:
-                collab_counts[author.name] = collab_counts.get(author.name, 0) + 1
-                collab_years[author.name] = max(collab_years.get(author.name, 0), pub.year)
+                collab = collabs.get(author.name)
+                if collab is None:
+                    collab = collabs[author.name] = Collaborator(name=author.name)
+                collab.publication_count += 1
+                if pub.year > collab.last_year:
+                    collab.last_year = pub.year
     collaborators = sorted(
-        [Collaborator(name=name, publication_count=collab_counts[name],
-                      last_year=collab_years[name])
-         for name in collab_counts],
+        collabs.values(),
         key=lambda c: (-c.last_year, -c.publication_count, c.name),
     )
 
@@ -84,10 +110,76 @@ def assemble(config: LabDataConfig, diagnostics: bool = False):
     # Back-link
     compute_backlinks(data)
 
-    if diagnostics:
-        return AssemblyResult(
-            data=data,
-            unresolved_authors=unresolved_authors,
-            unknown_projects=unknown_projects,
-        )
-    return data
+    return AssemblyResult(
+        data=data,
+        unresolved_authors=unresolved_authors,
+        unknown_projects=unknown_projects,
+    )
+
+
+def _file_stamp(path: Optional[str]) -> Optional[List[int]]:
+    """(mtime_ns, size) of a file or directory, or None if it is missing."""
+    if path is None:
+        return None
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _digest(obj) -> str:
+    # repr covers YAML values json cannot encode, e.g. dates under lab:
+    return hashlib.sha256(json.dumps(obj, sort_keys=True, default=repr).encode()).hexdigest()
+
+
+def _config_key(config: LabDataConfig) -> str:
+    """Hash of the configuration; names the cache file."""
+    return _digest(asdict(config))
+
+
+def _inputs_key(config: LabDataConfig) -> str:
+    """Hash of the stamps of everything assemble reads.
+
+    labdata's own sources are included so upgrades invalidate old results.
+    The PDF directory's stamp changes when files are added or removed.
+    """
+    inputs: List[Optional[str]] = [os.path.join(config.bib_dir, bf.name) for bf in config.bib_files]
+    inputs += [config.people_file, config.projects_file]
+    if config.pdf_base_url and not config.pdf_base_url.startswith(('http://', 'https://')):
+        inputs.append(config.pdf_base_url)
+    sources = sorted(str(p) for p in Path(__file__).parent.rglob('*.py'))
+
+    return _digest({
+        'inputs': [(p, _file_stamp(p)) for p in inputs],
+        'sources': [(p, _file_stamp(p)) for p in sources],
+    })
+
+
+def _load_cached(path: Path, inputs_key: str) -> Optional[AssemblyResult]:
+    try:
+        with open(path, 'rb') as f:
+            key, result = pickle.load(f)
+    except Exception:
+        return None  # missing, unreadable or stale pickle: rebuild
+    if key != inputs_key or not isinstance(result, AssemblyResult):
+        return None
+    return result
+
+
+def _store_cached(path: Path, inputs_key: str, result: AssemblyResult) -> None:
+    """Write the pickle atomically so concurrent runs never see a partial file.
+
+    The cache is best-effort: if it cannot be written, the run goes on.
+    """
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp, 'wb') as f:
+            pickle.dump((inputs_key, result), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
@@ -42,6 +42,8 @@ class LabDataConfig:
         pdf_base_url: "https://lab.edu/pdfs"
         people_file: "data/people.yaml"
         projects_file: "data/projects.yaml"
+        cache_dir: ".labdata_cache"   # optional; reuse results while inputs are unchanged
+        workers: 4                    # optional; parse large bib files in parallel
     """
     bib_dir: str
     bib_files: List[BibFile]
@@ -49,6 +51,8 @@ class LabDataConfig:
     people_file: Optional[str] = None
     projects_file: Optional[str] = None
     lab: Optional[Dict[str, str]] = None
+    cache_dir: Optional[str] = None
+    workers: int = 1
 
     @classmethod
     def from_yaml(cls, path: str) -> 'LabDataConfig':
@@ -67,4 +71,6 @@ class LabDataConfig:
             people_file=data.get('people_file'),
             projects_file=data.get('projects_file'),
             lab=data.get('lab'),
+            cache_dir=data.get('cache_dir'),
+            workers=data.get('workers', 1),
         )
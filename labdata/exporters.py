@@ -14,6 +14,12 @@ from pathlib import Path
 
 from .models import LabData
 
+try:
+    # Optional fast JSON encoder; its 2-space output matches json.dump's
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 
 def export_to_yaml(data: LabData, output_path: str):
     """Export LabData to a YAML file.
@@ -41,5 +47,13 @@ def export_to_json(data: LabData, output_path: str, indent: int = 2):
     output_file = Path(output_path)
     output_file.parent.mkdir(parents=True, exist_ok=True)
 
+    payload = data.to_dict()
+    if orjson is not None and indent == 2:
+        try:
+            output_file.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+            return
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits; json handles them
+
     with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(data.to_dict(), f, indent=indent, ensure_ascii=False)
+        json.dump(payload, f, indent=indent, ensure_ascii=False)
@@ -12,6 +12,8 @@ MIT License - see LICENSE file for details.
 """
 
 import re
+from functools import lru_cache
+from typing import List, Optional, Tuple
 
 # Comprehensive LaTeX accent → Unicode mapping
 # Covers the most common accents found in academic BibTeX files.
@@ -81,28 +83,153 @@ LATEX_ACCENTS = {
 }
 
 
+def _accent_variants():
+    """Map every spelling of each LATEX_ACCENTS command to its Unicode char."""
+    variants = {}
+    for latex, uni in LATEX_ACCENTS.items():
+        # With braces around the whole command: {\'e}
+        variants["{" + latex + "}"] = uni
+        # With braces around just the char: \'{e} or \"{u}
+        if len(latex) >= 2 and latex[-1].isalpha():
+            variants[latex[:-1] + "{" + latex[-1] + "}"] = uni
+        # Plain form
+        variants[latex] = uni
+    return variants
+
+
+_ACCENT_VARIANTS = _accent_variants()
+
+# Longest spelling first, so {\'e} wins over \'e and \oe over \o
+_ACCENT_RE = re.compile('|'.join(
+    re.escape(v) for v in sorted(_ACCENT_VARIANTS, key=len, reverse=True)
+))
+
+
 def replace_latex_accents(text: str) -> str:
     """Replace LaTeX accent commands with Unicode characters.
 
     Handles both {\\accent{char}} and {\\accent char} forms commonly
     found in BibTeX files. Braces around accent commands are also removed.
     """
-    if not isinstance(text, str):
+    if not isinstance(text, str) or '\\' not in text:
         return text
+    return _replace_latex_accents(text)
 
-    # Handle braced accent forms like {\\'e} or {\\\"u}
-    # These are common in BibTeX: {M{\\"u}ller}
-    for latex, uni in LATEX_ACCENTS.items():
-        # With braces around the whole command: {\'e}
-        text = text.replace("{" + latex + "}", uni)
-        # With braces around just the char: \'{e} or \"{u}
-        if len(latex) >= 2 and latex[-1].isalpha():
-            braced = latex[:-1] + "{" + latex[-1] + "}"
-            text = text.replace(braced, uni)
-        # Plain form
-        text = text.replace(latex, uni)
 
-    return text
+# Conversions are pure and the same names and venues recur across entries
+_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _replace_latex_accents(text: str) -> str:
+    return _ACCENT_RE.sub(lambda m: _ACCENT_VARIANTS[m.group()], text)
+
+
+# Math spans ($...$, not crossing a line break), kept verbatim
+_MATH_RE = re.compile(r'\$(.*?)\$')
+
+# Characters that start markup in LaTeX fields; text without any of them
+# converts to itself, and latex_to_markdown copies it through in runs.
+_MARKUP_START_RE = re.compile(r'[\\$^_{}]')
+_BRACE_RE = re.compile(r'[{}]')
+
+# Single-argument formatting commands → Markdown delimiter
+_MARKDOWN_DELIMITERS = {'textbf': '**', 'emph': '*', 'textit': '*'}
+
+# Super/subscript markers → HTML tag
+_SCRIPT_TAGS = {'^': 'sup', '_': 'sub'}
+
+
+def _braced_arg(text: str, i: int) -> Optional[Tuple[str, int]]:
+    """Return (content, end) for the balanced {...} group at text[i], or None."""
+    if text[i:i + 1] != '{':
+        return None
+    depth = 0
+    for m in _BRACE_RE.finditer(text, i):
+        depth += 1 if m.group() == '{' else -1
+        if depth == 0:
+            return text[i + 1:m.start()], m.end()
+    return None
+
+
+def _convert_markup(text: str, plain: bool = False) -> str:
+    """Convert formatting commands in one left-to-right scan.
+
+    Produces Markdown, or with plain=True just the content. Accents must
+    already be replaced. Command arguments are converted recursively and
+    stray braces dropped. Math spans are copied verbatim in Markdown mode;
+    plain mode treats $ as an ordinary character.
+    """
+    out: List[str] = []
+    pos = 0
+    while True:
+        m = _MARKUP_START_RE.search(text, pos)
+        if not m:
+            out.append(text[pos:])
+            return ''.join(out)
+        i = m.start()
+        out.append(text[pos:i])
+        c = text[i]
+        pos = i + 1
+
+        if c == '{' or c == '}':
+            continue
+
+        if c == '$':
+            math = None if plain else _MATH_RE.match(text, i)
+            if math:
+                out.append(math.group())
+                pos = math.end()
+            else:
+                out.append(c)
+            continue
+
+        if c in _SCRIPT_TAGS:
+            arg = _braced_arg(text, pos)
+            if arg:
+                content = _convert_markup(arg[0], plain)
+                if plain:
+                    out.append(content)
+                else:
+                    tag = _SCRIPT_TAGS[c]
+                    out.append(f"<{tag}>{content}</{tag}>")
+                pos = arg[1]
+            else:
+                out.append(c)
+            continue
+
+        # Backslash: formatting commands, anything else passes through
+        for name, delim in _MARKDOWN_DELIMITERS.items():
+            if text.startswith(name, pos):
+                after = pos + len(name)
+                arg = _braced_arg(text, after)
+                if arg:
+                    content = _convert_markup(arg[0], plain)
+                    out.append(content if plain else f"{delim}{content}{delim}")
+                    pos = arg[1]
+                elif name == 'textbf':
+                    # Orphaned \textbf: drop it and any following whitespace
+                    while after < len(text) and text[after].isspace():
+                        after += 1
+                    pos = after
+                else:
+                    out.append(c)
+                break
+        else:
+            if text.startswith('href', pos):
+                url = _braced_arg(text, pos + 4)
+                if url:
+                    label = _braced_arg(text, url[1])
+                    url_md = _convert_markup(url[0], plain)
+                    if label:
+                        label_md = _convert_markup(label[0], plain)
+                        out.append(label_md if plain else f"[{label_md}]({url_md})")
+                        pos = label[1]
+                    else:
+                        out.append(url_md if plain else f"[{url_md}]({url_md})")
+                        pos = url[1]
+                    continue
+            out.append(c)
 
 
 def latex_to_markdown(text: str) -> str:
@@ -117,43 +244,19 @@ def latex_to_markdown(text: str) -> str:
     - $...$ → $...$ (passed through for KaTeX/MathJax)
     - Remaining curly braces removed
     """
-    if not isinstance(text, str):
+    if not isinstance(text, str) or not _MARKUP_START_RE.search(text):
         return text
+    return _latex_to_markdown(text)
 
-    # Protect math expressions from further processing
-    math_blocks = []
-
-    def protect_math(m):
-        math_blocks.append(m.group(1))
-        return f"__MATH{len(math_blocks) - 1}__"
-
-    text = re.sub(r'\$(.*?)\$', protect_math, text)
-
-    # Apply accent replacement
-    text = replace_latex_accents(text)
-
-    # LaTeX formatting → Markdown
-    text = re.sub(r'\\textbf\{(.*?)\}', r'**\1**', text)
-    text = re.sub(r'\\textbf\s*', '', text)  # orphaned \textbf
-    text = re.sub(r'\\emph\{(.*?)\}', r'*\1*', text)
-    text = re.sub(r'\\textit\{(.*?)\}', r'*\1*', text)
-    text = re.sub(r'\\href\{(.*?)\}\{(.*?)\}', r'[\2](\1)', text)
-    text = re.sub(r'\\href\{(.*?)\}', r'[\1](\1)', text)
 
-    # Super/subscripts → HTML (universally supported in Markdown)
-    text = re.sub(r'\^\{(.*?)\}', r'<sup>\1</sup>', text)
-    text = re.sub(r'_\{(.*?)\}', r'<sub>\1</sub>', text)
+@lru_cache(maxsize=_CACHE_SIZE)
+def _latex_to_markdown(text: str) -> str:
+    # Apply accent replacement outside math; split() alternates text, math
+    parts = _MATH_RE.split(text)
+    parts[::2] = [replace_latex_accents(p) for p in parts[::2]]
+    parts[1::2] = [f"${p}$" for p in parts[1::2]]
 
-    # Remove remaining curly braces
-    text = text.replace('{', '').replace('}', '')
-
-    # Restore math expressions (kept as $...$ for KaTeX/MathJax)
-    def restore_math(m):
-        return f"${math_blocks[int(m.group(1))]}$"
-
-    text = re.sub(r'__MATH(\d+)__', restore_math, text)
-
-    return text
+    return _convert_markup(''.join(parts))
 
 
 def latex_to_text(text: str) -> str:
@@ -162,22 +265,11 @@ def latex_to_text(text: str) -> str:
     Useful for fields where Markdown is not appropriate (e.g., sort keys,
     plain-text exports).
     """
-    if not isinstance(text, str):
+    if not isinstance(text, str) or not _MARKUP_START_RE.search(text):
         return text
+    return _latex_to_text(text)
 
-    text = replace_latex_accents(text)
-
-    # Strip formatting commands, keep content
-    text = re.sub(r'\\textbf\{(.*?)\}', r'\1', text)
-    text = re.sub(r'\\textbf\s*', '', text)
-    text = re.sub(r'\\emph\{(.*?)\}', r'\1', text)
-    text = re.sub(r'\\textit\{(.*?)\}', r'\1', text)
-    text = re.sub(r'\\href\{(.*?)\}\{(.*?)\}', r'\2', text)
-    text = re.sub(r'\\href\{(.*?)\}', r'\1', text)
-    text = re.sub(r'\^\{(.*?)\}', r'\1', text)
-    text = re.sub(r'_\{(.*?)\}', r'\1', text)
-
-    # Remove remaining curly braces and math delimiters
-    text = text.replace('{', '').replace('}', '')
 
-    return text
+@lru_cache(maxsize=_CACHE_SIZE)
+def _latex_to_text(text: str) -> str:
+    return _convert_markup(replace_latex_accents(text), plain=True)
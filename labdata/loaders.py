@@ -8,10 +8,12 @@ MIT License - see LICENSE file for details.
 
 import yaml
 from typing import List
-from pathlib import Path
 
 from .models import Person, Project
 
+# libyaml-backed loader when PyYAML was built with it
+_SafeLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 
 def load_people(path: str) -> List[Person]:
     """Load people from a YAML file.
@@ -24,12 +26,12 @@ def load_people(path: str) -> List[Person]:
           status: "current"
           ...
     """
-    if not Path(path).exists():
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = yaml.load(f, Loader=_SafeLoader)
+    except FileNotFoundError:
         return []
 
-    with open(path, 'r', encoding='utf-8') as f:
-        data = yaml.safe_load(f)
-
     if not data or not isinstance(data, list):
         return []
 
@@ -66,12 +68,12 @@ def load_projects(path: str) -> List[Project]:
           website: "https://robotfeeding.io"
           status: "active"
     """
-    if not Path(path).exists():
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = yaml.load(f, Loader=_SafeLoader)
+    except FileNotFoundError:
         return []
 
-    with open(path, 'r', encoding='utf-8') as f:
-        data = yaml.safe_load(f)
-
     if not data or not isinstance(data, list):
         return []
 
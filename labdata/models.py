@@ -9,18 +9,23 @@ Author: Siddhartha Srinivasa <siddh@cs.washington.edu>
 MIT License - see LICENSE file for details.
 """
 
+import sys
 from dataclasses import dataclass, field
 from typing import Dict, Optional, List
 
+# Slotted dataclasses (Python 3.10+) store fields without a per-instance
+# __dict__: smaller objects and faster attribute access.
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class Author:
     """A resolved or unresolved author reference in a publication."""
     name: str
     person_id: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Publication:
     """A single publication with structured, renderer-agnostic data."""
     bib_id: str
@@ -69,7 +74,7 @@ class Publication:
         return d
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Person:
     """A lab member (current or alumni)."""
     id: str
@@ -125,7 +130,7 @@ class Person:
         return d
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Collaborator:
     """An external co-author not listed in people.yaml."""
     name: str
@@ -140,7 +145,7 @@ class Collaborator:
         }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Project:
     """A research project."""
     id: str
@@ -166,7 +171,7 @@ class Project:
         }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class LabData:
     """The fully resolved output: all entities with cross-references."""
     publications: List[Publication] = field(default_factory=list)
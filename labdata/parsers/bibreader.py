@@ -0,0 +1,246 @@
+"""
+Lightweight BibTeX reader.
+
+A single-pass scanner that yields the same entry dicts as bibtexparser's
+BibTexParser(common_strings=True) for well-formed files, without building
+its pyparsing grammar. Anything it does not handle raises BibSyntaxError
+so callers can fall back to bibtexparser.
+
+Copyright (c) 2024 Personal Robotics Laboratory, University of Washington
+Author: Siddhartha Srinivasa <siddh@cs.washington.edu>
+MIT License - see LICENSE file for details.
+"""
+
+import re
+from typing import Dict, Iterator, List, Pattern, Tuple
+
+# Entry types bibtexparser keeps by default; other types are skipped
+STANDARD_TYPES = frozenset({
+    'article', 'book', 'booklet', 'conference', 'inbook', 'incollection',
+    'inproceedings', 'manual', 'mastersthesis', 'misc', 'phdthesis',
+    'proceedings', 'techreport', 'unpublished',
+})
+
+# Month macros predefined by bibtexparser's common_strings option
+COMMON_STRINGS = {
+    'jan': 'January', 'feb': 'February', 'mar': 'March', 'apr': 'April',
+    'may': 'May', 'jun': 'June', 'jul': 'July', 'aug': 'August',
+    'sep': 'September', 'oct': 'October', 'nov': 'November', 'dec': 'December',
+}
+
+_WS_RE = re.compile(r'[ \t\r\n]*')
+_TYPE_RE = re.compile(r'@([A-Za-z]+)')
+_IDENT_CHAR_RE = re.compile(r'[A-Za-z0-9_$]')
+_STRING_NAME_RE = re.compile(r'[A-Za-z0-9_\-:]+')
+_FIELD_NAME_RE = re.compile(r'[A-Za-z0-9_\-().+]+')
+_INTEGER_RE = re.compile(r'[0-9]+')
+_BRACE_RE = re.compile(r'[{}]')
+_QUOTED_RE = re.compile(r'["{}]')
+
+# Comments (explicit or implicit) run until the next line starting with @
+_NEXT_ITEM_RE = re.compile(r'\n[ \t\r\n]*@')
+
+_CLOSERS = {'{': '}', '(': ')'}
+
+# A value is a '#'-joined list of (is_macro, text) parts
+_Parts = List[Tuple[bool, str]]
+
+
+class BibSyntaxError(ValueError):
+    """Input the lightweight reader does not handle."""
+
+
+def _strip_after_new_lines(s: str) -> str:
+    """Remove leading whitespace on all but the first line (as bibtexparser)."""
+    lines = s.splitlines()
+    if len(lines) > 1:
+        lines = [lines[0]] + [line.lstrip() for line in lines[1:]]
+    return '\n'.join(lines)
+
+
+class _Reader:
+    """Cursor over BibTeX source text with the @string table in scope."""
+
+    def __init__(self, text: str):
+        if text.startswith('\ufeff'):
+            text = text[1:]
+        # pyparsing expands tabs before bibtexparser sees the text
+        self.text = text.expandtabs()
+        self.pos = 0
+        self.strings: Dict[str, str] = dict(COMMON_STRINGS)
+
+    def error(self, msg: str) -> BibSyntaxError:
+        line = self.text.count('\n', 0, self.pos) + 1
+        return BibSyntaxError(f"{msg} (line {line})")
+
+    def skip_ws(self) -> None:
+        m = _WS_RE.match(self.text, self.pos)
+        if m:  # always; the pattern matches the empty string
+            self.pos = m.end()
+
+    def expect(self, char: str) -> None:
+        self.skip_ws()
+        if not self.text.startswith(char, self.pos):
+            raise self.error(f"expected {char!r}")
+        self.pos += 1
+
+    def skip_to_next_item(self) -> None:
+        m = _NEXT_ITEM_RE.search(self.text, self.pos)
+        self.pos = m.end() - 1 if m else len(self.text)
+
+    def entries(self) -> Iterator[dict]:
+        text = self.text
+        while True:
+            self.skip_ws()
+            if self.pos >= len(text):
+                return
+            if text[self.pos] != '@':
+                self.skip_to_next_item()
+                continue
+
+            m = _TYPE_RE.match(text, self.pos)
+            if not m or _IDENT_CHAR_RE.match(text, m.end()):
+                raise self.error("malformed entry type")
+            self.pos = m.end()
+            entry_type = m.group(1).lower()
+
+            if entry_type == 'comment':
+                self.skip_to_next_item()
+            elif entry_type == 'string':
+                self.read_string_def()
+            elif entry_type == 'preamble':
+                closer = self.open_block()
+                self.read_value()
+                self.expect(closer)
+            else:
+                entry = self.read_entry(entry_type)
+                if entry is not None:
+                    yield entry
+
+    def open_block(self) -> str:
+        self.skip_ws()
+        closer = _CLOSERS.get(self.text[self.pos:self.pos + 1])
+        if closer is None:
+            raise self.error("expected '{' or '('")
+        self.pos += 1
+        return closer
+
+    def read_string_def(self) -> None:
+        closer = self.open_block()
+        self.skip_ws()
+        m = _STRING_NAME_RE.match(self.text, self.pos)
+        if not m:
+            raise self.error("malformed @string name")
+        self.pos = m.end()
+        self.expect('=')
+        parts = self.read_expression()
+        self.expect(closer)
+        self.strings[m.group().lower()] = self.clean_value(parts)
+
+    def read_entry(self, entry_type: str):
+        closer = self.open_block()
+        comma = self.text.find(',', self.pos)
+        if comma < 0:
+            raise self.error("entry without fields")
+        key = self.text[self.pos:comma].strip()
+        if not key or any(c.isspace() for c in key):
+            raise self.error("malformed citation key")
+        self.pos = comma + 1
+
+        pairs: List[Tuple[str, _Parts]] = []
+        while True:
+            self.skip_ws()
+            m = _FIELD_NAME_RE.match(self.text, self.pos)
+            if not m:
+                raise self.error("malformed field name")
+            self.pos = m.end()
+            self.expect('=')
+            parts = [
+                (is_macro, part if is_macro else _strip_after_new_lines(part))
+                for is_macro, part in self.read_value()
+            ]
+            pairs.append((m.group(), parts))
+
+            self.skip_ws()
+            if self.text.startswith(closer, self.pos):
+                self.pos += 1
+                break
+            self.expect(',')
+            self.skip_ws()
+            if self.text.startswith(closer, self.pos):
+                self.pos += 1
+                break
+
+        if entry_type not in STANDARD_TYPES:
+            return None
+
+        # bibtexparser keeps the first occurrence of a field, in reverse order
+        fields = {name: parts for name, parts in reversed(pairs)}
+        entry = {name.lower(): self.clean_value(parts) for name, parts in fields.items()}
+        entry['ENTRYTYPE'] = entry_type
+        entry['ID'] = key
+        return entry
+
+    def read_value(self) -> _Parts:
+        self.skip_ws()
+        m = _INTEGER_RE.match(self.text, self.pos)
+        if m:
+            self.pos = m.end()
+            return [(False, m.group())]
+        return self.read_expression()
+
+    def read_expression(self) -> _Parts:
+        parts: _Parts = []
+        while True:
+            self.skip_ws()
+            char = self.text[self.pos:self.pos + 1]
+            if char == '{':
+                parts.append((False, self.read_delimited(_BRACE_RE)))
+            elif char == '"':
+                parts.append((False, self.read_delimited(_QUOTED_RE)))
+            else:
+                m = _STRING_NAME_RE.match(self.text, self.pos)
+                if not m:
+                    raise self.error("malformed value")
+                self.pos = m.end()
+                parts.append((True, m.group().lower()))
+            self.skip_ws()
+            if not self.text.startswith('#', self.pos):
+                return parts
+            self.pos += 1
+
+    def read_delimited(self, token_re: Pattern) -> str:
+        """Read a {...} or "..." value with balanced braces; return its content."""
+        start = self.pos
+        depth = 0
+        for m in token_re.finditer(self.text, start + 1):
+            char = m.group()
+            if char == '{':
+                depth += 1
+            elif depth == 0:
+                if char == '}' and token_re is _QUOTED_RE:
+                    break
+                self.pos = m.end()
+                return self.text[start + 1:m.start()]
+            elif char == '}':
+                depth -= 1
+        raise self.error("unbalanced braces")
+
+    def clean_value(self, parts: _Parts) -> str:
+        if len(parts) == 1 and not parts[0][0]:
+            value = parts[0][1]
+            return '' if value == '{}' else value
+        try:
+            return ''.join(self.strings[p] if is_macro else p for is_macro, p in parts)
+        except KeyError as e:
+            raise self.error(f"undefined @string {e.args[0]!r}") from None
+
+
+def iter_entries(text: str) -> Iterator[dict]:
+    """Yield entry dicts from BibTeX source text.
+
+    Field names are lowercased, and ENTRYTYPE and ID are added, matching
+    bibtexparser. Raises BibSyntaxError on input this reader does not
+    handle.
+    """
+    return _Reader(text).entries()
@@ -9,24 +9,121 @@ Author: Siddhartha Srinivasa <siddh@cs.washington.edu>
 MIT License - see LICENSE file for details.
 """
 
+import os
 import re
-from pathlib import Path
-from typing import List, Optional
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from operator import attrgetter
+from typing import Callable, Dict, List, Optional, Set, Tuple, Union
 
-import bibtexparser
+from bibtexparser.bibdatabase import BibDatabase
 from bibtexparser.bparser import BibTexParser
 from bibtexparser.customization import author as parse_author
 
 from ..latex import replace_latex_accents, latex_to_markdown, latex_to_text
 from ..models import Author, Publication
+from .bibreader import BibSyntaxError, iter_entries
+
+
+# Hosts whose URLs are surfaced as video_url rather than the generic url
+_VIDEO_URL_RE = re.compile(r'youtube\.com|youtu\.be|vimeo\.com')
+
+# Minimum combined size of bib files needing a parse before they are
+# parsed in separate processes, one file each (when workers > 1).
+PARALLEL_MIN_BYTES = 1_000_000
+
+# Trailing superscript affiliation on a last name: Smith$^{1}$ or Smith^{1}
+_AFFILIATION_RE = re.compile(r'(.*?)\$?\^\{(.+?)\}\$?$')
+
+# Parenthetical nicknames in first names: "John (Jack)"
+_PARENTHETICAL_RE = re.compile(r"\(.*?\)")
+
+# str.translate table deleting curly braces from journal names
+_DELETE_BRACES = str.maketrans('', '', '{}')
+
+# Shared bibtexparser instance for the fallback path, built on first use
+_bibtexparser: Optional[BibTexParser] = None
+
+
+# Parsed entries by absolute path, with the (mtime_ns, size) they were read
+# at; tuples, so no caller can add or drop cached entries
+_entry_cache: Dict[str, Tuple[Tuple[int, int], Tuple[dict, ...]]] = {}
 
 
 def parse_bibtex_file(path: str) -> list:
-    """Parse a BibTeX file and return raw entry dicts."""
+    """Parse a BibTeX file and return raw entry dicts.
+
+    Uses the lightweight reader in bibreader, falling back to bibtexparser
+    for files it does not handle (malformed entries, undefined @string
+    macros) so results always match bibtexparser.
+
+    Parsed entries are cached until the file's mtime or size changes;
+    each call returns fresh dicts that callers may modify.
+    """
+    key = os.path.abspath(path)
+    cached = _entry_cache.get(key)
+    if cached is None or cached[0] != _file_stamp(key):
+        cached = _entry_cache[key] = _read_bibtex_file(key)
+    return [dict(e) for e in cached[1]]
+
+
+def _file_stamp(path: str) -> Tuple[int, int]:
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+
+def _read_bibtex_file(path: str) -> Tuple[Tuple[int, int], Tuple[dict, ...]]:
+    """Parse a file from disk; returns its (mtime_ns, size) stamp and entries."""
+    stamp = _file_stamp(path)
     with open(path, 'r', encoding='utf-8') as f:
-        parser = BibTexParser(common_strings=True)
-        bib = bibtexparser.load(f, parser)
-    return bib.entries
+        text = f.read()
+    try:
+        return stamp, tuple(iter_entries(text))
+    except BibSyntaxError:
+        return stamp, tuple(_bibtexparser_entries(text))
+
+
+def _parse_stale_files_in_parallel(paths: List[str], workers: int) -> None:
+    """Fill the entry cache for out-of-date files, one process per file.
+
+    Does nothing unless more than one worker is allowed, several files need
+    parsing, and together they are large enough to repay process start-up.
+    """
+    if workers < 2:
+        return
+    stale = []
+    size = 0
+    for path in dict.fromkeys(paths):
+        try:
+            stamp = _file_stamp(path)
+        except OSError:
+            continue  # parse_bibtex_file reports it
+        cached = _entry_cache.get(path)
+        if cached is None or cached[0] != stamp:
+            stale.append(path)
+            size += stamp[1]
+
+    workers = min(len(stale), workers)
+    if workers < 2 or size < PARALLEL_MIN_BYTES:
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for path, result in zip(stale, executor.map(_read_bibtex_file, stale)):
+            _entry_cache[path] = result
+
+
+def _bibtexparser_entries(text: str) -> list:
+    """Parse with a shared BibTexParser; building its grammar is the costly part.
+
+    The parser accumulates into its database, so each call starts a fresh one.
+    """
+    global _bibtexparser
+    if _bibtexparser is None:
+        _bibtexparser = BibTexParser(common_strings=True)
+        _bibtexparser.expect_multiple_parse = True
+    _bibtexparser.bib_database = BibDatabase()
+    _bibtexparser.bib_database.load_common_strings()
+    return _bibtexparser.parse(text).entries
 
 
 def parse_author_list(raw_author_field: str) -> List[Author]:
@@ -40,11 +137,11 @@ def parse_author_list(raw_author_field: str) -> List[Author]:
         return []
 
     try:
-        name_list = parse_author({'author': raw_author_field})['author']
+        name_list: List[str] = parse_author({'author': raw_author_field})['author']
     except Exception:
         return [Author(name=raw_author_field.strip())]
 
-    authors = []
+    authors: List[Author] = []
     for name in name_list:
         # Strip equal contribution markers (* or ^{*} which becomes <sup>*</sup>)
         if isinstance(name, str):
@@ -56,91 +153,118 @@ def parse_author_list(raw_author_field: str) -> List[Author]:
     return authors
 
 
-def _abbreviate_name(name) -> str:
+def _abbreviate_name(name: Union[str, Dict[str, str]]) -> str:
     """Abbreviate a parsed author name to 'F. M. Last' format."""
     if isinstance(name, str):
-        name = replace_latex_accents(name)
-        if ',' in name:
-            last, first = [s.strip() for s in name.split(',', 1)]
-            name = {'first': first, 'last': last}
-        else:
-            return name
-
-    if not isinstance(name, dict):
+        return _abbreviate_name_str(name)
+    elif isinstance(name, dict):
+        return _abbreviate_name_parts({k: replace_latex_accents(v) for k, v in name.items()})
+    else:
         return str(name)
 
-    last = name.get('last', '')
-    last = replace_latex_accents(last)
 
-    # Extract superscript affiliations from last name
-    sup = ''
-    match = re.search(r'(.*?)\$?\^\{(.+?)\}\$?$', last)
-    if match:
-        last = match.group(1)
-        sup = f"<sup>{match.group(2)}</sup>"
+@lru_cache(maxsize=4096)
+def _abbreviate_name_str(name: str) -> str:
+    """_abbreviate_name for "Last, First" strings; authors recur across entries."""
+    # Accents are replaced once here, before splitting into parts
+    name = replace_latex_accents(name)
+    if ',' not in name:
+        return name
+    last, first = [s.strip() for s in name.split(',', 1)]
+    return _abbreviate_name_parts({'first': first, 'last': last})
 
-    initials = ''
-    if 'first' in name:
-        first = replace_latex_accents(name['first'])
-        cleaned = re.sub(r"\(.*?\)", "", first).strip()
-        initials = ' '.join(
-            part[0] + '.' for part in cleaned.split() if part
-        )
 
+def _abbreviate_name_parts(name: Dict[str, str]) -> str:
+    last, sup = _extract_superscript(name.get('last', ''))
+    initials = _initials(name['first']) if 'first' in name else ''
     return f"{initials} {last}{sup}".strip()
 
 
+def _extract_superscript(last: str) -> Tuple[str, str]:
+    """Split a trailing ^{...} affiliation off a last name, as (last, "<sup>...</sup>")."""
+    match = _AFFILIATION_RE.search(last)
+    if match:
+        return match.group(1), f"<sup>{match.group(2)}</sup>"
+    return last, ''
+
+
+def _initials(first: str) -> str:
+    """'John (Jack) Paul' -> 'J. P.'"""
+    return ' '.join(part[0] + '.' for part in _PARENTHETICAL_RE.sub("", first).split())
+
+
 def format_authors_string(authors: List[Author]) -> str:
     """Format a list of Authors into a display string.
 
     Uses 'and' for 2 authors, commas + 'and' for 3+.
     """
-    names = [a.name for a in authors]
+    names: List[str] = [a.name for a in authors]
     if len(names) <= 2:
         return ' and '.join(names)
-    return ', '.join(names[:-1]) + ', and ' + names[-1]
+    names[-1] = 'and ' + names[-1]
+    return ', '.join(names)
 
 
-def format_venue(entry: dict) -> str:
-    """Format venue string from a BibTeX entry dict. Uses Markdown (not HTML)."""
-    typ = entry.get("ENTRYTYPE", "")
+def _venue_phdthesis(entry: dict) -> str:
+    return f"PhD thesis, {entry.get('school', '')}, {entry.get('year', '')}"
+
+
+def _venue_mastersthesis(entry: dict) -> str:
+    return f"Masters thesis, {entry.get('school', '')}, {entry.get('year', '')}"
+
+
+def _venue_techreport(entry: dict) -> str:
+    kind = entry.get("type", "Technical Report")
+    num = entry.get("number", "")
+    report = f"{kind} {num}" if num else kind
+    return f"{report}, {entry.get('institution', '')}, {entry.get('year', '')}"
+
+
+def _venue_misc(entry: dict) -> str:
+    arxiv_id = entry.get("eprint")
+    if arxiv_id:
+        return f"*arXiv:{arxiv_id}*, {entry.get('year', '')}"
+    return _venue_default(entry)
+
+
+def _venue_article(entry: dict) -> str:
+    journal = entry.get("journal", "").translate(_DELETE_BRACES)
+    vol = entry.get("volume", "")
+    num = entry.get("number", "")
+    year = entry.get("year", "")
+    parts = [f"*{journal}*"]
+    if vol:
+        parts.append(f"{vol}({num})" if num else f"{vol}")
+    if year:
+        parts.append(f"{year}")
+    return ", ".join(parts)
+
+
+def _venue_inproceedings(entry: dict) -> str:
     year = entry.get("year", "")
+    conf = latex_to_text(entry.get("booktitle", ""))
+    return f"*{conf}*, {year}" if conf else str(year)
+
+
+def _venue_default(entry: dict) -> str:
+    return str(entry.get("year", ""))
+
 
-    if typ == "phdthesis":
-        return f"PhD thesis, {entry.get('school', '')}, {year}"
-    elif typ == "mastersthesis":
-        return f"Masters thesis, {entry.get('school', '')}, {year}"
-    elif typ == "techreport":
-        kind = entry.get("type", "Technical Report")
-        num = entry.get("number", "")
-        inst = entry.get("institution", "")
-        note = kind
-        if num:
-            note += f" {num}"
-        note += f", {inst}, {year}"
-        return note
-    elif typ == "misc":
-        arxiv_id = entry.get("eprint")
-        if arxiv_id:
-            return f"*arXiv:{arxiv_id}*, {year}"
-    elif typ == "article":
-        journal = entry.get("journal", "").replace('{', '').replace('}', '')
-        vol = entry.get("volume", "")
-        num = entry.get("number", "")
-        note = f"*{journal}*"
-        if vol:
-            note += f", {vol}"
-            if num:
-                note += f"({num})"
-        if year:
-            note += f", {year}"
-        return note
-    elif typ == "inproceedings":
-        conf = entry.get("booktitle", "").replace('{', '').replace('}', '')
-        conf = latex_to_text(conf)
-        return f"*{conf}*, {year}" if conf else str(year)
-
-    return str(year)
+# BibTeX entry type → venue formatter; other types show just the year
+_VENUE_FORMATTERS = {
+    "phdthesis": _venue_phdthesis,
+    "mastersthesis": _venue_mastersthesis,
+    "techreport": _venue_techreport,
+    "misc": _venue_misc,
+    "article": _venue_article,
+    "inproceedings": _venue_inproceedings,
+}
+
+
+def format_venue(entry: dict) -> str:
+    """Format venue string from a BibTeX entry dict. Uses Markdown (not HTML)."""
+    formatter = _VENUE_FORMATTERS.get(entry.get("ENTRYTYPE", ""), _venue_default)
+    return formatter(entry)
 
 
 def extract_note(entry: dict) -> Optional[str]:
@@ -154,7 +278,7 @@ def extract_note(entry: dict) -> Optional[str]:
 def extract_video_url(entry: dict) -> Optional[str]:
     """Extract video URL if the entry's URL points to a video platform."""
     url = entry.get("url", "")
-    if url and any(p in url for p in ["youtube.com", "youtu.be", "vimeo.com"]):
+    if url and _VIDEO_URL_RE.search(url):
         return url
     return None
 
@@ -185,19 +309,75 @@ def parse_project_ids(entry: dict) -> List[str]:
     project_field = entry.get("project", "").strip()
     if not project_field:
         return []
-    project_field = project_field.strip('{}')
-    return [p.strip() for p in project_field.split(',') if p.strip()]
+    parts = (p.strip() for p in project_field.strip('{}').split(','))
+    # Interned: the same few project IDs recur across many publications
+    return [sys.intern(p) for p in parts if p]
 
 
 def resolve_pdf_url(bib_id: str, pdf_base_url: Optional[str]) -> Optional[str]:
-    """Construct a PDF URL for a given bib entry."""
+    """Construct a PDF URL for a given bib entry.
+
+    For a local pdf_base_url, the PDF must exist. To resolve many entries,
+    use make_pdf_resolver, which scans the directory once.
+    """
     if not pdf_base_url:
         return None
     base = pdf_base_url.rstrip('/')
     pdf_path = f"{base}/{bib_id}.pdf"
     if pdf_base_url.startswith(('http://', 'https://')):
         return pdf_path
-    return pdf_path if Path(pdf_path).exists() else None
+    return pdf_path if os.path.exists(pdf_path) else None
+
+
+def _scan_pdf_dir(path: str) -> Tuple[Set[str], Set[str]]:
+    """Scan a PDF directory once.
+
+    Returns the bib IDs with an exact <id>.pdf, and the case-folded IDs of
+    every PDF whatever its case, which a case-insensitive filesystem may
+    also resolve.
+    """
+    try:
+        names = os.listdir(path)
+    except OSError:
+        return set(), set()
+    exact = {name[:-4] for name in names if name.endswith('.pdf')}
+    folded = {name[:-4].casefold() for name in names if name.casefold().endswith('.pdf')}
+    return exact, folded
+
+
+def _remote_pdf_url(bib_id: str, base: str) -> str:
+    return f"{base}/{bib_id}.pdf"
+
+
+def _local_pdf_url(
+    bib_id: str, base: str, available: Set[str], folded: Set[str],
+) -> Optional[str]:
+    pdf_path = f"{base}/{bib_id}.pdf"
+    if bib_id in available:
+        return pdf_path
+    # Only a case-only mismatch is worth a stat; anything else is absent
+    if bib_id.casefold() in folded and os.path.exists(pdf_path):
+        return pdf_path
+    return None
+
+
+def _no_pdf_url(bib_id: str) -> None:
+    return None
+
+
+def make_pdf_resolver(pdf_base_url: Optional[str]) -> Callable[[str], Optional[str]]:
+    """Return a bib_id → PDF URL function, choosing remote/local/none once.
+
+    Equivalent to resolve_pdf_url, but the base URL is inspected (and a
+    local directory scanned) once rather than per entry.
+    """
+    if not pdf_base_url:
+        return _no_pdf_url
+    base = pdf_base_url.rstrip('/')
+    if pdf_base_url.startswith(('http://', 'https://')):
+        return partial(_remote_pdf_url, base=base)
+    available, folded = _scan_pdf_dir(pdf_base_url)
+    return partial(_local_pdf_url, base=base, available=available, folded=folded)
 
 
 def format_bibtex_entry(entry: dict) -> str:
@@ -222,31 +402,35 @@ def entry_to_publication(
     entry: dict,
     category: str,
     pdf_base_url: Optional[str] = None,
+    pdf_resolver: Optional[Callable[[str], Optional[str]]] = None,
 ) -> Publication:
-    """Convert a raw BibTeX entry dict to a Publication dataclass."""
-    title = latex_to_markdown(entry.get("title", ""))
-    authors = parse_author_list(entry.get("author", ""))
+    """Convert a raw BibTeX entry dict to a Publication dataclass.
 
-    # Extract URL (non-video)
-    url = entry.get("url", "")
+    pdf_resolver (from make_pdf_resolver) takes precedence over
+    pdf_base_url when given.
+    """
+    get = entry.get
+    bib_id, title, author, year = get("ID", ""), get("title", ""), get("author", ""), get("year", 0)
+
+    # Extract URL (non-video); don't duplicate a video URL in the generic url field
     video_url = extract_video_url(entry)
-    if video_url:
-        url = None  # Don't duplicate video URL in generic url field
+    url = None if video_url else get("url") or None
 
     return Publication(
-        bib_id=entry.get("ID", ""),
-        title=title,
-        authors=authors,
-        year=int(entry.get("year", 0)),
+        bib_id=bib_id,
+        title=latex_to_markdown(title),
+        authors=parse_author_list(author),
+        year=int(year),
         venue=format_venue(entry),
         category=category,
-        entry_type=entry.get("ENTRYTYPE", ""),
-        abstract=entry.get("abstract"),
+        entry_type=get("ENTRYTYPE", ""),
+        abstract=get("abstract"),
         note=extract_note(entry),
-        pdf_url=resolve_pdf_url(entry.get("ID", ""), pdf_base_url),
+        pdf_url=(pdf_resolver(bib_id) if pdf_resolver
+                 else resolve_pdf_url(bib_id, pdf_base_url)),
         doi_url=construct_doi_url(entry),
         arxiv_url=construct_arxiv_url(entry),
-        url=url if url and not video_url else None,
+        url=url,
         video_url=video_url,
         project_ids=parse_project_ids(entry),
         bibtex=format_bibtex_entry(entry),
@@ -257,6 +441,7 @@ def parse_all_publications(
     bib_dir: str,
     bib_files: list,
     pdf_base_url: Optional[str] = None,
+    workers: int = 1,
 ) -> List[Publication]:
     """Parse all configured BibTeX files and return a flat list of Publications.
 
@@ -264,19 +449,32 @@ def parse_all_publications(
         bib_dir: Directory containing the BibTeX files
         bib_files: List of dicts with 'name' and 'category' keys
         pdf_base_url: Base URL/path for PDFs
+        workers: Maximum processes for parsing large files; 1 (the default)
+            parses in this process. Above 1, scripts must call this from
+            under an ``if __name__ == "__main__":`` guard, as the spawn
+            start method re-imports the main module in each worker.
 
     Returns:
         List of Publication objects, sorted by year descending
     """
-    publications = []
+    paths = []
+    file_categories = []
     for bib_file in bib_files:
         name = bib_file['name'] if isinstance(bib_file, dict) else bib_file.name
         category = bib_file['category'] if isinstance(bib_file, dict) else bib_file.category
-        path = f"{bib_dir}/{name}"
-        entries = parse_bibtex_file(path)
-        for entry in entries:
-            pub = entry_to_publication(entry, category, pdf_base_url)
-            publications.append(pub)
+        paths.append(os.path.abspath(f"{bib_dir}/{name}"))
+        file_categories.append(category)
+    _parse_stale_files_in_parallel(paths, workers)
+
+    entries = []
+    categories = []
+    for path, category in zip(paths, file_categories):
+        file_entries = parse_bibtex_file(path)
+        entries.extend(file_entries)
+        categories.extend([category] * len(file_entries))
+
+    convert = partial(entry_to_publication, pdf_resolver=make_pdf_resolver(pdf_base_url))
+    publications = [convert(e, c) for e, c in zip(entries, categories)]
 
-    publications.sort(key=lambda p: p.year, reverse=True)
+    publications.sort(key=attrgetter('year'), reverse=True)
     return publications
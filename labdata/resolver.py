@@ -14,10 +14,18 @@ import re
 import sys
 import unicodedata
 from difflib import SequenceMatcher
+from functools import lru_cache
 from typing import Dict, List, Optional, Set, Tuple
 
 from .models import Author, Publication, Person, Project, LabData
 
+try:
+    # Optional C implementation of the Indel (LCS) similarity, an upper
+    # bound on SequenceMatcher.ratio(); used only to skip hopeless names
+    from rapidfuzz.fuzz import ratio as _indel_ratio
+except ImportError:
+    _indel_ratio = None  # type: ignore[assignment]
+
 
 # Default fuzzy match threshold (0.0 to 1.0)
 FUZZY_THRESHOLD = 0.85
@@ -27,25 +35,43 @@ FUZZY_THRESHOLD = 0.85
 _ABBREVIATED_NAME_RE = re.compile(r'^[a-z] [a-z]+$')
 
 
+@lru_cache(maxsize=4096)
 def normalize_name(name: str) -> str:
     """Normalize a name for matching.
 
     Lowercases, strips accents, removes periods and extra whitespace,
-    and standardizes initial formats.
+    and standardizes initial formats. Results are cached, since the same
+    author names recur across publications.
     """
     # Lowercase
-    name = name.lower().strip()
-    # Remove accents (é → e, ü → u, etc.)
-    name = ''.join(
-        c for c in unicodedata.normalize('NFD', name)
-        if unicodedata.category(c) != 'Mn'
-    )
+    name = name.lower()
+    # Remove accents (é → e, ü → u, etc.); ASCII has none to strip
+    if not name.isascii():
+        name = ''.join(
+            c for c in unicodedata.normalize('NFD', name)
+            if unicodedata.category(c) != 'Mn'
+        )
     # Remove periods
     name = name.replace('.', '')
     # Remove superscript HTML tags
-    name = re.sub(r'<sup>.*?</sup>', '', name)
-    # Collapse whitespace
-    name = re.sub(r'\s+', ' ', name).strip()
+    if '<sup>' in name:
+        name = _strip_sup_tags(name)
+    # Collapse whitespace; interned so index keys and lookups share one object
+    return sys.intern(' '.join(name.split()))
+
+
+def _strip_sup_tags(name: str) -> str:
+    """Remove <sup>...</sup> spans (not crossing a line break)."""
+    start = name.find('<sup>')
+    while start >= 0:
+        end = name.find('</sup>', start + 5)
+        if end < 0:
+            break
+        if '\n' in name[start:end]:
+            start = name.find('<sup>', start + 1)
+            continue
+        name = name[:start] + name[end + 6:]
+        start = name.find('<sup>', start)
     return name
 
 
@@ -93,11 +119,30 @@ def build_alias_index(people: List[Person]) -> Dict[str, str]:
     return index
 
 
-def fuzzy_match(name: str, index: Dict[str, str], threshold: float = FUZZY_THRESHOLD) -> Optional[str]:
+def _index_matchers(index: Dict[str, str]) -> List[Tuple[str, SequenceMatcher, str]]:
+    """Build a SequenceMatcher per indexed name, as (name, matcher, person_id).
+
+    The indexed name is the matcher's second sequence, whose lookup tables
+    are the costly part; fuzzy_match only swaps in the first sequence.
+    """
+    return [
+        (indexed_name, SequenceMatcher(None, '', indexed_name), person_id)
+        for indexed_name, person_id in index.items()
+    ]
+
+
+def fuzzy_match(
+    name: str,
+    index: Dict[str, str],
+    threshold: float = FUZZY_THRESHOLD,
+    matchers: Optional[List[Tuple[str, SequenceMatcher, str]]] = None,
+) -> Optional[str]:
     """Try fuzzy matching a name against the alias index.
 
     Skips matching for single-initial abbreviated names (e.g., "S. Zhang")
     since they lack enough information for reliable fuzzy matching.
+    matchers, if given, must be _index_matchers(index); resolve_authors
+    builds it once for all its lookups.
 
     Returns the person_id of the best match above the threshold, or None.
     """
@@ -107,11 +152,27 @@ def fuzzy_match(name: str, index: Dict[str, str], threshold: float = FUZZY_THRES
     if is_abbreviated(normalized):
         return None
 
+    # An exact key is the only name with ratio 1.0
+    hit = index.get(normalized)
+    if hit is not None:
+        return hit
+
+    if matchers is None:
+        matchers = _index_matchers(index)
+
     best_ratio = 0.0
     best_id = None
 
-    for indexed_name, person_id in index.items():
-        ratio = SequenceMatcher(None, normalized, indexed_name).ratio()
+    for indexed_name, matcher, person_id in matchers:
+        # Cheap upper bounds on ratio(): skip names that can neither reach
+        # the threshold nor beat the current best
+        floor = max(threshold, best_ratio)
+        if _indel_ratio is not None and _indel_ratio(normalized, indexed_name) < floor * 100 - 1e-6:
+            continue
+        matcher.set_seq1(normalized)
+        if matcher.real_quick_ratio() < floor or matcher.quick_ratio() < floor:
+            continue
+        ratio = matcher.ratio()
         if ratio > best_ratio:
             best_ratio = ratio
             best_id = person_id
@@ -141,6 +202,7 @@ def resolve_authors(
         return []
 
     index = build_alias_index(people)
+    matchers = _index_matchers(index)
     unresolved: Set[str] = set()
 
     for pub in publications:
@@ -153,7 +215,7 @@ def resolve_authors(
                 continue
 
             # Try fuzzy match
-            person_id = fuzzy_match(author.name, index, fuzzy_threshold)
+            person_id = fuzzy_match(author.name, index, fuzzy_threshold, matchers)
             if person_id:
                 author.person_id = person_id
                 continue
@@ -194,33 +256,38 @@ def compute_backlinks(data: LabData) -> None:
     """
     people_by_id = {p.id: p for p in data.people}
     projects_by_id = {p.id: p for p in data.projects}
+    project_people: Dict[str, Set[str]] = {p.id: set() for p in data.projects}
+
+    # IDs already linked, seeded from existing lists so reruns add no duplicates
+    person_pubs = {pid: set(p.publication_ids) for pid, p in people_by_id.items()}
+    project_pubs = {pid: set(p.publication_ids) for pid, p in projects_by_id.items()}
 
     for pub in data.publications:
+        bib_id = pub.bib_id
+
         # Back-link people
         for author in pub.authors:
-            if author.person_id and author.person_id in people_by_id:
-                person = people_by_id[author.person_id]
-                if pub.bib_id not in person.publication_ids:
-                    person.publication_ids.append(pub.bib_id)
+            if not author.person_id:
+                continue
+            linked = person_pubs.get(author.person_id)
+            if linked is not None and bib_id not in linked:
+                linked.add(bib_id)
+                people_by_id[author.person_id].publication_ids.append(bib_id)
 
-        # Back-link projects
+        # Back-link projects, inferring project people from the same pass
         for pid in pub.project_ids:
-            if pid in projects_by_id:
-                project = projects_by_id[pid]
-                if pub.bib_id not in project.publication_ids:
-                    project.publication_ids.append(pub.bib_id)
+            linked = project_pubs.get(pid)
+            if linked is not None:
+                if bib_id not in linked:
+                    linked.add(bib_id)
+                    projects_by_id[pid].publication_ids.append(bib_id)
+                project_people[pid].update(
+                    a.person_id for a in pub.authors if a.person_id
+                )
 
     # Update publication counts
     for person in data.people:
         person.publication_count = len(person.publication_ids)
 
-    # Infer project people from publications
     for project in data.projects:
-        people_set: Set[str] = set()
-        for pub_id in project.publication_ids:
-            pub = next((p for p in data.publications if p.bib_id == pub_id), None)
-            if pub:
-                for author in pub.authors:
-                    if author.person_id:
-                        people_set.add(author.person_id)
-        project.people_ids = sorted(people_set)
+        project.people_ids = sorted(project_people[project.id])
@@ -0,0 +1,53 @@
+"""Tests for the lightweight BibTeX reader."""
+
+import pytest
+from pathlib import Path
+
+import bibtexparser
+from bibtexparser.bparser import BibTexParser
+
+from labdata.parsers.bibreader import iter_entries, BibSyntaxError
+
+
+FIXTURES = Path(__file__).parent / "fixtures"
+DATA_BIB = Path(__file__).parent.parent / "data" / "bib"
+
+
+def _bibtexparser_entries(text):
+    return bibtexparser.loads(text, BibTexParser(common_strings=True)).entries
+
+
+class TestMatchesBibtexparser:
+    @pytest.mark.parametrize("path", sorted(DATA_BIB.glob("*.bib")) + [FIXTURES / "sample.bib"],
+                             ids=lambda p: p.name)
+    def test_bib_files(self, path):
+        text = path.read_text(encoding='utf-8')
+        assert list(iter_entries(text)) == _bibtexparser_entries(text)
+
+    @pytest.mark.parametrize("text", [
+        '@article{a, title={One}, Title={Two}, title={Three}, year=2020}',
+        '@misc(k, note = "a {b "c"} d" # jan, year = 1999,)',
+        '@string{a = "A"}\n@string{b = a # { B}}\n@article{k, booktitle = b # ", " # "x"}',
+        '@article{e, title={}, note={{}}, abstract="{}"}',
+        'text me@x.com\n  @article{y,\n title = {Multi\n     line\n\t value}}',
+        '@comment{skip @article{z, title={no}} }\n@article{y, title = {T}}',
+        '@online{x, url={u}}\n@ARTICLE{K, TITLE = {T}, Year = 2001}',
+        '@article{a, title={A\tB}, note="x\ty"}\n\t@misc{b,\tabstract = {\tC\t\tD}}',
+    ], ids=["duplicates", "quoted", "macros", "empty", "comments", "explicit-comment", "types",
+            "tabs"])
+    def test_edge_cases(self, text):
+        assert list(iter_entries(text)) == _bibtexparser_entries(text)
+
+
+class TestUnsupportedInput:
+    def test_undefined_macro(self):
+        with pytest.raises(BibSyntaxError):
+            list(iter_entries('@article{k, booktitle = nosuch}'))
+
+    def test_malformed_entry(self):
+        with pytest.raises(BibSyntaxError):
+            list(iter_entries('@article{k title={T}}'))
+
+    def test_unbalanced_braces(self):
+        with pytest.raises(BibSyntaxError):
+            list(iter_entries('@article{k, title={T}'))
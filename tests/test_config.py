@@ -19,6 +19,8 @@ class TestLabDataConfig:
             "pdf_base_url": "https://example.com/pdfs",
             "people_file": "data/people.yaml",
             "projects_file": "data/projects.yaml",
+            "cache_dir": ".labdata_cache",
+            "workers": 4,
         }
         config_path = tmp_path / "lab.yaml"
         with open(config_path, 'w') as f:
@@ -32,6 +34,8 @@ class TestLabDataConfig:
         assert config.pdf_base_url == "https://example.com/pdfs"
         assert config.people_file == "data/people.yaml"
         assert config.projects_file == "data/projects.yaml"
+        assert config.cache_dir == ".labdata_cache"
+        assert config.workers == 4
 
     def test_minimal_config(self, tmp_path):
         config_data = {
@@ -49,6 +53,8 @@ class TestLabDataConfig:
         assert config.pdf_base_url is None
         assert config.people_file is None
         assert config.projects_file is None
+        assert config.cache_dir is None
+        assert config.workers == 1
 
     def test_lab_metadata(self, tmp_path):
         config_data = {
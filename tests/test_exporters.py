@@ -114,3 +114,17 @@ class TestExportToJson:
         with open(out, 'r') as f:
             loaded = json.load(f)
         assert loaded == {"publications": [], "people": [], "projects": [], "collaborators": []}
+
+    def test_output_matches_json_module(self, tmp_path, sample_data):
+        """The fast encoder, when installed, writes exactly what json.dump would."""
+        sample_data.publications[0].title = "Café   \"quoted\""
+        out = tmp_path / "output.json"
+        export_to_json(sample_data, str(out))
+        expected = json.dumps(sample_data.to_dict(), indent=2, ensure_ascii=False)
+        assert out.read_text(encoding="utf-8") == expected
+
+    def test_other_indent(self, tmp_path, sample_data):
+        out = tmp_path / "output.json"
+        export_to_json(sample_data, str(out), indent=4)
+        assert out.read_text(encoding="utf-8") == json.dumps(
+            sample_data.to_dict(), indent=4, ensure_ascii=False)
@@ -43,6 +43,11 @@ class TestReplaceLatexAccents:
         assert replace_latex_accents("\\o") == "ø"
         assert replace_latex_accents("\\l") == "ł"
 
+    def test_ligature_not_split(self):
+        """\\oe must not be read as \\o followed by e."""
+        assert replace_latex_accents("C{\\oe}ur") == "Cœur"
+        assert replace_latex_accents("\\OE") == "Œ"
+
     def test_braced_forms(self):
         """BibTeX commonly wraps accents in braces: {M{\\"u}ller}"""
         assert replace_latex_accents('{M{\\"u}ller}') == "{Müller}"
@@ -121,6 +126,23 @@ class TestLatexToMarkdown:
         result = latex_to_markdown("\\textbf something")
         assert "\\textbf" not in result
 
+    def test_nested_braces_in_argument(self):
+        assert latex_to_markdown("\\textbf{A {B} C}") == "**A B C**"
+
+    def test_formatting_inside_href_text(self):
+        result = latex_to_markdown("\\href{https://example.com}{\\textbf{here}}")
+        assert result == "[**here**](https://example.com)"
+
+    def test_consecutive_hrefs(self):
+        result = latex_to_markdown("\\href{a}\\href{b}{B}")
+        assert result == "[a](a)[B](b)"
+
+    def test_math_inside_formatting(self):
+        assert latex_to_markdown("\\emph{$O(n)$ time}") == "*$O(n)$ time*"
+
+    def test_math_followed_by_subscript(self):
+        assert latex_to_markdown("$x$_{1}") == "$x$<sub>1</sub>"
+
     def test_non_string_input(self):
         assert latex_to_markdown(None) is None
 
@@ -150,5 +172,9 @@ class TestLatexToText:
     def test_braces_removed(self):
         assert latex_to_text("{Some} {Title}") == "Some Title"
 
+    def test_nested_commands(self):
+        assert latex_to_text("\\emph{a \\textbf{b} c}") == "a b c"
+        assert latex_to_text("\\href{u}{\\textit{x}}_{\\emph{i}}") == "xi"
+
     def test_non_string_input(self):
         assert latex_to_text(None) is None
@@ -1,5 +1,7 @@
 """Tests for labdata data models."""
 
+import pickle
+
 from labdata.models import Author, Publication, Person, Project, LabData
 
 
@@ -51,6 +53,19 @@ class TestPublication:
         assert d["doi_url"] == "https://doi.org/10.1234/test"
         assert d["project_ids"] == ["robotics"]
 
+    def test_pickle_round_trip(self):
+        """Publications are pickled by the assemble result cache (cache_dir)."""
+        pub = Publication(
+            bib_id="doe2024",
+            title="A Paper",
+            authors=[Author(name="J. Doe", person_id="jdoe")],
+            year=2024,
+            venue="*RSS*, 2024",
+            category="Conference Papers",
+            entry_type="inproceedings",
+        )
+        assert pickle.loads(pickle.dumps(pub)) == pub
+
 
 class TestPerson:
     def test_current_member(self):
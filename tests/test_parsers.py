@@ -1,5 +1,6 @@
 """Tests for the BibTeX parsing pipeline."""
 
+import os
 import pytest
 from pathlib import Path
 
@@ -13,10 +14,13 @@ from labdata.parsers.bibtex import (
     construct_doi_url,
     construct_arxiv_url,
     parse_project_ids,
+    resolve_pdf_url,
+    make_pdf_resolver,
     entry_to_publication,
     parse_all_publications,
 )
 from labdata.models import Author
+from labdata.parsers import bibtex
 
 
 FIXTURES = Path(__file__).parent / "fixtures"
@@ -30,6 +34,35 @@ class TestParseBibtexFile:
         assert "smith2024robot" in ids
         assert "doe2023planning" in ids
 
+    def test_falls_back_to_bibtexparser(self, tmp_path):
+        # A malformed entry is skipped by bibtexparser; the next one survives
+        path = tmp_path / "bad.bib"
+        path.write_text(
+            "@article{k title={T}}\n@article{j, title={J}}\n", encoding="utf-8"
+        )
+        entries = parse_bibtex_file(str(path))
+        assert [e["ID"] for e in entries] == ["j"]
+
+    def test_fallback_parses_are_independent(self, tmp_path):
+        first = tmp_path / "first.bib"
+        first.write_text("@article{a title={A}}\n@article{b, month=jan}\n", encoding="utf-8")
+        second = tmp_path / "second.bib"
+        second.write_text("@article{c title={C}}\n@article{d, month=feb}\n", encoding="utf-8")
+        assert [e["ID"] for e in parse_bibtex_file(str(first))] == ["b"]
+        entries = parse_bibtex_file(str(second))
+        assert [e["ID"] for e in entries] == ["d"]
+        assert entries[0]["month"] == "February"
+
+    def test_cached_until_file_changes(self, tmp_path):
+        path = tmp_path / "refs.bib"
+        path.write_text("@article{a, title={A}}\n", encoding="utf-8")
+        entries = parse_bibtex_file(str(path))
+        entries[0]["title"] = "changed"
+        assert parse_bibtex_file(str(path))[0]["title"] == "A"
+
+        path.write_text("@article{a, title={A}}\n@article{b, title={B}}\n", encoding="utf-8")
+        assert [e["ID"] for e in parse_bibtex_file(str(path))] == ["a", "b"]
+
 
 class TestParseAuthorList:
     def test_single_author(self):
@@ -51,6 +84,15 @@ class TestParseAuthorList:
         assert len(authors) == 3
         assert "Müller" in authors[2].name
 
+    def test_superscript_affiliation_passes_through(self):
+        authors = parse_author_list("Smith$^{1}$, John and M{\\\"u}ller^{2}, Hans")
+        assert authors[0].name == "J. Smith<sup>1</sup>"
+        assert authors[1].name == "H. Müller<sup>2</sup>"
+
+    def test_equal_contribution_marker_stripped(self):
+        authors = parse_author_list("Smith$^{*}$, John and Doe*, Jane")
+        assert [a.name for a in authors] == ["J. Smith", "J. Doe"]
+
     def test_empty_field(self):
         assert parse_author_list("") == []
         assert parse_author_list("   ") == []
@@ -106,6 +148,14 @@ class TestFormatVenue:
         assert "*Proceedings of Robotics: Science and Systems*" in result
         assert "2023" in result
 
+    def test_inproceedings_latex_booktitle(self):
+        entry = {
+            "ENTRYTYPE": "inproceedings",
+            "booktitle": "{Journ\\'ees Fran\\c{c}aises de \\emph{Robotique}}",
+            "year": "2022",
+        }
+        assert format_venue(entry) == "*Journées Françaises de Robotique*, 2022"
+
     def test_phdthesis(self):
         entry = {
             "ENTRYTYPE": "phdthesis",
@@ -123,6 +173,21 @@ class TestFormatVenue:
         result = format_venue(entry)
         assert "*arXiv:2301.12345*" in result
 
+    def test_techreport(self):
+        entry = {
+            "ENTRYTYPE": "techreport",
+            "number": "CMU-RI-TR-12-34",
+            "institution": "Carnegie Mellon University",
+            "year": "2012",
+        }
+        assert format_venue(entry) == (
+            "Technical Report CMU-RI-TR-12-34, Carnegie Mellon University, 2012"
+        )
+
+    def test_misc_without_eprint(self):
+        entry = {"ENTRYTYPE": "misc", "year": "2023"}
+        assert format_venue(entry) == "2023"
+
     def test_unknown_type(self):
         entry = {"ENTRYTYPE": "unknown", "year": "2024"}
         assert format_venue(entry) == "2024"
@@ -202,6 +267,57 @@ class TestParseProjectIds:
         assert parse_project_ids({"project": ""}) == []
 
 
+class TestResolvePdfUrl:
+    def test_remote(self):
+        assert resolve_pdf_url("smith2024", "https://lab.edu/pdfs/") == (
+            "https://lab.edu/pdfs/smith2024.pdf"
+        )
+
+    def test_local_exists(self, tmp_path):
+        (tmp_path / "smith2024.pdf").write_bytes(b"")
+        assert resolve_pdf_url("smith2024", str(tmp_path)) == f"{tmp_path}/smith2024.pdf"
+        assert resolve_pdf_url("doe2023", str(tmp_path)) is None
+
+    def test_local_prescanned(self, tmp_path):
+        (tmp_path / "smith2024.pdf").write_bytes(b"")
+        (tmp_path / "notes.txt").write_bytes(b"")
+        resolver = make_pdf_resolver(str(tmp_path))
+        assert resolver("smith2024") == f"{tmp_path}/smith2024.pdf"
+        assert resolver("notes") is None
+        assert resolver("doe2023") is None
+
+    def test_prescan_falls_back_to_filesystem(self, tmp_path, monkeypatch):
+        """A case-insensitive filesystem finds Smith2024.pdf for smith2024."""
+        (tmp_path / "Smith2024.pdf").write_bytes(b"")
+        monkeypatch.setattr(
+            bibtex.os.path, "exists",
+            lambda p: Path(p).name.lower() in {n.lower() for n in os.listdir(tmp_path)},
+        )
+        expected = f"{tmp_path}/smith2024.pdf"
+        assert make_pdf_resolver(str(tmp_path))("smith2024") == expected
+        assert make_pdf_resolver(str(tmp_path))("doe2023") is None
+
+    def test_prescan_stats_only_case_mismatches(self, tmp_path, monkeypatch):
+        (tmp_path / "smith2024.pdf").write_bytes(b"")
+        resolver = make_pdf_resolver(str(tmp_path))
+
+        def fail(path):
+            raise AssertionError(f"unexpected stat of {path}")
+        monkeypatch.setattr(bibtex.os.path, "exists", fail)
+        assert resolver("smith2024") == f"{tmp_path}/smith2024.pdf"
+        assert resolver("doe2023") is None
+
+    def test_resolver_matches_resolve_pdf_url(self, tmp_path):
+        (tmp_path / "smith2024.pdf").write_bytes(b"")
+        for base in [None, "https://lab.edu/pdfs/", str(tmp_path)]:
+            resolver = make_pdf_resolver(base)
+            for bib_id in ["smith2024", "doe2023"]:
+                assert resolver(bib_id) == resolve_pdf_url(bib_id, base)
+
+    def test_resolver_missing_directory(self, tmp_path):
+        assert make_pdf_resolver(str(tmp_path / "missing"))("smith2024") is None
+
+
 class TestEntryToPublication:
     def test_basic(self):
         entry = {
@@ -251,3 +367,26 @@ class TestParseAllPublications:
         assert pubs[0].year >= pubs[-1].year
         # Check first pub has structured authors
         assert all(isinstance(a, Author) for a in pubs[0].authors)
+
+    def test_files_parsed_in_parallel(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(bibtex, "PARALLEL_MIN_BYTES", 0)
+        (tmp_path / "a.bib").write_text("@article{a, title={A}, year=2020}\n", encoding="utf-8")
+        (tmp_path / "b.bib").write_text("@article{b, title={B}, year=2021}\n", encoding="utf-8")
+        pubs = parse_all_publications(
+            bib_dir=str(tmp_path),
+            bib_files=[{"name": "a.bib", "category": "A"}, {"name": "b.bib", "category": "B"}],
+            workers=2,
+        )
+        assert [(p.bib_id, p.category) for p in pubs] == [("b", "B"), ("a", "A")]
+        assert str(tmp_path / "a.bib") in bibtex._entry_cache
+
+    def test_no_processes_by_default(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(bibtex, "PARALLEL_MIN_BYTES", 0)
+        monkeypatch.setattr(bibtex, "ProcessPoolExecutor", None)
+        (tmp_path / "a.bib").write_text("@article{a, title={A}, year=2020}\n", encoding="utf-8")
+        (tmp_path / "b.bib").write_text("@article{b, title={B}, year=2021}\n", encoding="utf-8")
+        pubs = parse_all_publications(
+            bib_dir=str(tmp_path),
+            bib_files=[{"name": "a.bib", "category": "A"}, {"name": "b.bib", "category": "B"}],
+        )
+        assert [p.bib_id for p in pubs] == ["b", "a"]
@@ -1,5 +1,6 @@
 """Tests for the resolver: author matching, project resolution, back-linking."""
 
+import datetime
 import pytest
 from pathlib import Path
 
@@ -14,6 +15,7 @@ from labdata.resolver import (
     resolve_projects,
     compute_backlinks,
 )
+from labdata import assembler
 from labdata.assembler import assemble
 from labdata.config import LabDataConfig, BibFile
 
@@ -104,6 +106,14 @@ class TestFuzzyMatch:
         result = fuzzy_match("Completely Different Name", index)
         assert result is None
 
+    def test_exact_key(self):
+        index = {"john smith": "jsmith", "jon smith": "jsmyth"}
+        assert fuzzy_match("John Smith", index) == "jsmith"
+
+    def test_best_match_wins(self):
+        index = {"john smithe": "first", "john smith": "jsmith", "jon smith": "jsmyth"}
+        assert fuzzy_match("John Smith Jr", index, threshold=0.5) == "jsmith"
+
 
 class TestResolveAuthors:
     def _make_pub(self, author_names):
@@ -328,3 +338,47 @@ class TestAssembleEndToEnd:
         first_pub = d["publications"][0]
         assert isinstance(first_pub["authors"], list)
         assert "name" in first_pub["authors"][0]
+
+    def test_cache_dir(self, tmp_path, monkeypatch):
+        """A cached result is reused until an input file changes."""
+        bib = tmp_path / "sample.bib"
+        bib.write_text((FIXTURES / "sample.bib").read_text(encoding="utf-8"), encoding="utf-8")
+        config = LabDataConfig(
+            bib_dir=str(tmp_path),
+            bib_files=[BibFile(name="sample.bib", category="Test Papers")],
+            people_file=str(FIXTURES / "people.yaml"),
+            cache_dir=str(tmp_path / "cache"),
+        )
+        data = assemble(config)
+        assert len(list((tmp_path / "cache").glob("*.pkl"))) == 1
+
+        def fail(*args, **kwargs):
+            raise AssertionError("inputs unchanged, expected a cache hit")
+        with monkeypatch.context() as m:
+            m.setattr(assembler, "parse_all_publications", fail)
+            assert assemble(config).to_dict() == data.to_dict()
+
+        bib.write_text("@article{new2025, title={New}, author={Smith, John}, year=2025}\n",
+                       encoding="utf-8")
+        result = assemble(config, diagnostics=True)
+        assert [p.bib_id for p in result.data.publications] == ["new2025"]
+        assert len(list((tmp_path / "cache").glob("*.pkl"))) == 1
+
+    def test_cache_dir_with_date_in_lab(self, tmp_path):
+        config = LabDataConfig(
+            bib_dir=str(FIXTURES),
+            bib_files=[BibFile(name="sample.bib", category="Test Papers")],
+            lab={"name": "Test Lab", "founded": datetime.date(2010, 9, 1)},
+            cache_dir=str(tmp_path / "cache"),
+        )
+        assert assemble(config).to_dict() == assemble(config).to_dict()
+
+    def test_cache_dir_unwritable(self, tmp_path):
+        blocker = tmp_path / "file"
+        blocker.write_text("", encoding="utf-8")
+        config = LabDataConfig(
+            bib_dir=str(FIXTURES),
+            bib_files=[BibFile(name="sample.bib", category="Test Papers")],
+            cache_dir=str(blocker / "cache"),
+        )
+        assert len(assemble(config).publications) > 0
@@ -1,5 +1,8 @@
 """Smoke tests to verify the package loads and basic functionality works."""
 
+import subprocess
+import sys
+
 import labdata
 
 
@@ -9,6 +12,20 @@ def test_package_imports():
     assert labdata.__version__ == "2.0.0"
 
 
+def test_package_import_is_lazy():
+    """Importing the package alone should not load the parsing stack."""
+    code = "import sys, labdata; print('bibtexparser' in sys.modules, 'yaml' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.split() == ["False", "False"]
+
+
+def test_submodules_reachable_from_package():
+    """Submodules stay reachable as attributes of the package."""
+    code = "import labdata; print(labdata.models.Author.__name__, labdata.parsers.__name__)"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.split() == ["Author", "labdata.parsers"]
+
+
 def test_core_classes_importable():
     """Verify core classes are importable from the package."""
     from labdata import (